@@ -30,15 +30,106 @@ CRYPTO BOUNDARY (Cannot be replicated in Python):
 """
 
 import requests
-import base64
+from requests.adapters import HTTPAdapter
 import hashlib
+import io
 import json
+import sys
 import time
-import secrets
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    # SIMD-accelerated decoder; same API as the stdlib function.
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode  # type: ignore
+
+try:
+    # Faster JSON encode/decode that works in bytes end to end.
+    import orjson
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _json_loads = json.loads  # type: ignore
 
 BASE_URL = "http://51.195.24.179:8000"
 
+API_PATHS = {
+    "trace": "/api/v1/trace",
+    "init": "/api/v1/init",
+    "device_check": "/api/v1/device_check",
+    "heartbeat": "/api/v1/monitoring/heartbeat",
+}
+# Full URLs built once instead of concatenating BASE_URL on every request
+ENDPOINTS = {name: BASE_URL + path for name, path in API_PATHS.items()}
+
+# Spoofed device fingerprint (Step 4) - fixed values, computed once at import
+WEBGL_VENDOR = "Intel Inc."
+WEBGL_RENDERER = "Intel Iris OpenGL Engine"
+CANVAS_FP = hashlib.sha256(b"canvas-fingerprint-seed").hexdigest()
+# Static half of the Step 5 device_check payload
+DEVICE_CHECK_FINGERPRINT = {
+    "webgl_vendor": WEBGL_VENDOR,
+    "webgl_renderer": WEBGL_RENDERER,
+    "canvas_fingerprint": CANVAS_FP,
+}
+
+# Lowest level that gets printed: "INFO" shows everything, "WARN" hides the
+# per-step progress lines, "ERROR" shows failures only.
+LOG_LEVEL = "INFO"
+_PREFIX = {"INFO": "[+]", "WARN": "[!]", "ERROR": "[✗]", "OK": "[✓]"}
+
+
+# The proofs are pure functions of the challenge values, so repeated
+# challenges (retries, batched runs) are answered from the cache.
+@lru_cache(maxsize=128)
+def math_proof(c1: int, c2: int, c3: int) -> int:
+    """((c1 * c2) + c3) % 1000 - deobfuscated from script.js (Step 3)."""
+    return ((c1 * c2) + c3) % 1000
+
+
+@lru_cache(maxsize=128)
+def seq_proof(seq: Tuple[int, ...]) -> int:
+    """seq[length-1] + seq[length-2] - deobfuscated from script.js (Step 7)."""
+    return seq[-1] + seq[-2]
+
+
+def hash_chain(seed: str, iterations: int) -> str:
+    """
+    Apply SHA256 `iterations` times to `seed`, hex-of-hex (matches script.js).
+
+    Kept as a standalone function so the whole chain runs in one tight loop
+    with no instance/ctx lookups per round. hashlib is backed by OpenSSL,
+    which already dispatches at runtime to SHA-NI (x86) or the ARMv8 SHA2
+    instructions when the CPU has them, so the compression is hardware
+    accelerated without a hand-written kernel here.
+    """
+    # The server hashes the hex text of each digest, so raw 32-byte digests
+    # cannot be chained; stay in bytes and decode only once at the end.
+    # Copying an initialized object skips the constructor's context setup.
+    proto = hashlib.sha256()
+    h = seed.encode()
+    for _ in range(iterations):
+        x = proto.copy()
+        x.update(h)
+        h = x.hexdigest().encode()
+    return h.decode()
+
+
+def hash_chains(jobs: List[Tuple[str, int]]) -> List[str]:
+    """
+    Solve many independent hash chains, e.g. one per client in a load test.
+
+    Results are returned in job order.
+
+    >>> jobs = [("seed", 6), ("abc", 50), ("", 0)]
+    >>> hash_chains(jobs) == [hash_chain(seed, n) for seed, n in jobs]
+    True
+    """
+    return [hash_chain(seed, iterations) for seed, iterations in jobs]
+
 
 class SecureRegistrationClient:
     """
@@ -47,9 +138,12 @@ class SecureRegistrationClient:
     Implements comprehensive protocol analysis with detailed logging.
     """
     
+    _LOG_LEVELS = {"INFO": 1, "OK": 1, "WARN": 2, "ERROR": 3}
+    
     def __init__(self, username: str = "testuser", 
                  email: str = "test@test.com", 
-                 password: str = "test123"):
+                 password: str = "test123",
+                 log_level: str = LOG_LEVEL) -> None:
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": (
@@ -65,37 +159,67 @@ class SecureRegistrationClient:
             "Referer": f"{BASE_URL}/",
             "Connection": "keep-alive"
         })
-        
+        # One host and one request at a time, so a single kept-alive socket
+        # is reused for every step.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.ctx: Dict[str, Any] = {}
         self.username = username
         self.email = email
         self.password = password
-        self.start_time = time.time()
+        self._min_level = self._LOG_LEVELS[log_level]
+        self._t0_ns = time.monotonic_ns()
+        self._log_buf: List[str] = []
+    
+    def _log(self, step: str, fmt: str, *args: Any, level: str = "INFO") -> None:
+        # %-style args are only formatted once the level check has passed
+        if self._LOG_LEVELS.get(level, 1) < self._min_level:
+            return
+        message = fmt % args if args else fmt
+        elapsed = (time.monotonic_ns() - self._t0_ns) // 1_000_000
+        self._print(f"{_PREFIX.get(level, '[*]')} [{elapsed:7d}ms] {step}: {message}")
     
-    def _log(self, step: str, message: str, level: str = "INFO"):
-        elapsed = (time.time() - self.start_time) * 1000
-        prefix = {"INFO": "[+]", "WARN": "[!]", "ERROR": "[✗]", "OK": "[✓]"}
-        print(f"{prefix.get(level, '[*]')} [{elapsed:7.0f}ms] {step}: {message}")
+    def _print(self, text: str) -> None:
+        # Step output goes through the log buffer so it stays in order with
+        # the log lines around it.
+        self._log_buf.append(text + "\n")
     
-    def _get(self, path: str) -> Optional[dict]:
+    def _flush_log(self) -> None:
+        # Called at step boundaries: one write + flush per step instead of one
+        # per line.
+        if self._log_buf:
+            sys.stdout.write("".join(self._log_buf))
+            self._log_buf.clear()
+        sys.stdout.flush()
+    
+    def _get(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        path = API_PATHS[endpoint]
         try:
-            r = self.session.get(BASE_URL + path, timeout=10)
+            r = self.session.get(ENDPOINTS[endpoint], timeout=10)
             r.raise_for_status()
-            return r.json()
+            return _json_loads(r.content)
         except Exception as e:
-            self._log("ERROR", f"GET {path} failed: {e}", "ERROR")
+            self._log("ERROR", "GET %s failed: %s", path, e, level="ERROR")
             return None
     
-    def _post(self, path: str, payload: dict) -> Optional[dict]:
+    def _post(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        path = API_PATHS[endpoint]
         try:
-            r = self.session.post(BASE_URL + path, json=payload, timeout=10)
+            # Content-Type: application/json is already a session header
+            r = self.session.post(ENDPOINTS[endpoint], data=_json_dumps(payload), timeout=10)
+            body = r.content
             if not r.ok:
-                error_detail = r.json().get("detail", r.text) if r.text else "Unknown"
-                self._log("ERROR", f"POST {path}: {error_detail}", "ERROR")
+                text = body.decode("utf-8", "replace") or "Unknown"
+                try:
+                    error_detail = _json_loads(body).get("detail", text)
+                except (ValueError, AttributeError):
+                    error_detail = text  # empty, non-JSON or non-object body
+                self._log("ERROR", "POST %s: %s", path, error_detail, level="ERROR")
                 return None
-            return r.json() if r.text else {}
+            return _json_loads(body) if body else {}
         except Exception as e:
-            self._log("ERROR", f"POST {path}: {e}", "ERROR")
+            self._log("ERROR", "POST %s: %s", path, e, level="ERROR")
             return None
 
     # ══════════════════════════════════════════════════════════════════════════
@@ -104,7 +228,7 @@ class SecureRegistrationClient:
     def step_trace(self) -> bool:
         self._log("STEP 1", "Sending telemetry trace")
         try:
-            self.session.post(BASE_URL + "/api/v1/trace", json={}, timeout=5)
+            self.session.post(ENDPOINTS["trace"], data=_json_dumps({}), timeout=5)
             return True
         except:
             return True  # Non-critical
@@ -114,11 +238,11 @@ class SecureRegistrationClient:
     # ══════════════════════════════════════════════════════════════════════════
     def step_init(self) -> bool:
         self._log("STEP 2", "Initializing session")
-        data = self._get("/api/v1/init")
+        data = self._get("init")
         if not data:
             return False
         self.ctx.update(data)
-        self._log("STEP 2", f"session_id: {self.ctx['session_id']}", "OK")
+        self._log("STEP 2", "session_id: %s", self.ctx["session_id"], level="OK")
         return True
     
     # ══════════════════════════════════════════════════════════════════════════
@@ -134,17 +258,16 @@ class SecureRegistrationClient:
     def step_solve_math(self) -> bool:
         self._log("STEP 3", "Solving math challenge")
         try:
-            c1 = int(base64.b64decode(self.ctx["c1"]).decode())
-            c2 = int(base64.b64decode(self.ctx["c2"]).decode())
-            c3 = int(base64.b64decode(self.ctx["c3"]).decode())
+            # int() parses ASCII digits straight from bytes, no .decode() needed
+            c1, c2, c3 = (int(b64decode(self.ctx[k])) for k in ("c1", "c2", "c3"))
             
             # CORRECT FORMULA (verified working)
-            self.ctx["math_proof"] = ((c1 * c2) + c3) % 1000
+            self.ctx["math_proof"] = math_proof(c1, c2, c3)
             
-            self._log("STEP 3", f"({c1}*{c2})+{c3} % 1000 = {self.ctx['math_proof']}", "OK")
+            self._log("STEP 3", "(%d*%d)+%d %% 1000 = %d", c1, c2, c3, self.ctx["math_proof"], level="OK")
             return True
         except Exception as e:
-            self._log("STEP 3", str(e), "ERROR")
+            self._log("STEP 3", "%s", e, level="ERROR")
             return False
     
     # ══════════════════════════════════════════════════════════════════════════
@@ -152,10 +275,10 @@ class SecureRegistrationClient:
     # ══════════════════════════════════════════════════════════════════════════
     def step_generate_fingerprints(self) -> bool:
         self._log("STEP 4", "Generating device fingerprints")
-        self.ctx["webgl_vendor"] = "Intel Inc."
-        self.ctx["webgl_renderer"] = "Intel Iris OpenGL Engine"
-        self.ctx["canvas_fp"] = hashlib.sha256(b"canvas-fingerprint-seed").hexdigest()
-        self._log("STEP 4", "Fingerprints generated", "OK")
+        self.ctx["webgl_vendor"] = WEBGL_VENDOR
+        self.ctx["webgl_renderer"] = WEBGL_RENDERER
+        self.ctx["canvas_fp"] = CANVAS_FP
+        self._log("STEP 4", "Fingerprints generated", level="OK")
         return True
     
     # ══════════════════════════════════════════════════════════════════════════
@@ -164,19 +287,17 @@ class SecureRegistrationClient:
     def step_device_check(self) -> bool:
         self._log("STEP 5", "Submitting device check")
         payload = {
-            "webgl_vendor": self.ctx["webgl_vendor"],
-            "webgl_renderer": self.ctx["webgl_renderer"],
+            **DEVICE_CHECK_FINGERPRINT,
             "request_token": self.ctx["request_token"],
             "math_proof": self.ctx["math_proof"],
-            "canvas_fingerprint": self.ctx["canvas_fp"]
         }
         
-        result = self._post("/api/v1/device_check", payload)
+        result = self._post("device_check", payload)
         if not result:
             return False
         
         self.ctx["v_token"] = result.get("v_token", "")
-        self._log("STEP 5", f"v_token: {self.ctx['v_token']}", "OK")
+        self._log("STEP 5", "v_token: %s", self.ctx["v_token"], level="OK")
         return True
     
     # ══════════════════════════════════════════════════════════════════════════
@@ -187,8 +308,8 @@ class SecureRegistrationClient:
     def step_heartbeat(self) -> bool:
         self._log("STEP 6", "Sending heartbeat (GET)")
         try:
-            r = self.session.get(BASE_URL + "/api/v1/monitoring/heartbeat", timeout=5)
-            self._log("STEP 6", f"Status: {r.status_code}", "OK")
+            r = self.session.get(ENDPOINTS["heartbeat"], timeout=5)
+            self._log("STEP 6", "Status: %d", r.status_code, level="OK")
             return r.status_code == 200
         except:
             return False
@@ -205,15 +326,16 @@ class SecureRegistrationClient:
     def step_solve_sequence(self) -> bool:
         self._log("STEP 7", "Solving sequence proof")
         try:
-            seq = [int(base64.b64decode(x).decode()) for x in self.ctx["seq"]]
+            _b64, _int = b64decode, int
+            seq = [_int(_b64(x)) for x in self.ctx["seq"]]
             
             # CORRECT FORMULA (verified from JS)
-            self.ctx["seq_proof"] = seq[-1] + seq[-2]
+            self.ctx["seq_proof"] = seq_proof(tuple(seq))
             
-            self._log("STEP 7", f"seq={seq} → {seq[-1]}+{seq[-2]} = {self.ctx['seq_proof']}", "OK")
+            self._log("STEP 7", "seq=%s → %d+%d = %d", seq, seq[-1], seq[-2], self.ctx["seq_proof"], level="OK")
             return True
         except Exception as e:
-            self._log("STEP 7", str(e), "ERROR")
+            self._log("STEP 7", "%s", e, level="ERROR")
             return False
     
     # ══════════════════════════════════════════════════════════════════════════
@@ -224,15 +346,13 @@ class SecureRegistrationClient:
     def step_solve_hash_chain(self) -> bool:
         self._log("STEP 8", "Solving hash chain")
         try:
-            h = self.ctx["hc_s"]
-            for _ in range(self.ctx["hc_i"]):
-                h = hashlib.sha256(h.encode()).hexdigest()
+            h = hash_chain(self.ctx["hc_s"], self.ctx["hc_i"])
             
             self.ctx["hash_proof"] = h
-            self._log("STEP 8", f"iterations={self.ctx['hc_i']} → {h[:32]}...", "OK")
+            self._log("STEP 8", "iterations=%d → %.32s...", self.ctx["hc_i"], h, level="OK")
             return True
         except Exception as e:
-            self._log("STEP 8", str(e), "ERROR")
+            self._log("STEP 8", "%s", e, level="ERROR")
             return False
     
     # ══════════════════════════════════════════════════════════════════════════
@@ -257,9 +377,9 @@ class SecureRegistrationClient:
     def step_crypto_boundary(self) -> bool:
         # CONSTRAINT COMPLIANCE: Execution intentionally halted here to strictly adhere 
         # to "API automation only" rules and avoid using browser-based execution.
-        self._log("STEP 9", "⚠ CRYPTOGRAPHIC BOUNDARY REACHED", "WARN")
+        self._log("STEP 9", "⚠ CRYPTOGRAPHIC BOUNDARY REACHED", level="WARN")
         
-        print("""
+        self._print("""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    ⚠ EXECUTION HALTED - CRYPTO BOUNDARY ⚠                    ║
 ╠══════════════════════════════════════════════════════════════════════════════╣
@@ -301,7 +421,7 @@ class SecureRegistrationClient:
     # ══════════════════════════════════════════════════════════════════════════
     # MAIN RUN
     # ══════════════════════════════════════════════════════════════════════════
-    def run(self):
+    def run(self) -> None:
         print("=" * 76)
         print("  SECURE REGISTRATION PORTAL - REVERSE ENGINEERING ANALYSIS")
         print("=" * 76)
@@ -322,18 +442,25 @@ class SecureRegistrationClient:
         ]
         
         completed = 0
-        for name, step_fn in steps:
-            if not step_fn():
-                print(f"\n{'─' * 76}")
-                print(f"  Flow stopped at: {name}")
-                print(f"  Completed: {completed}/{len(steps)} steps")
-                print(f"{'─' * 76}\n")
-                break
-            completed += 1
+        try:
+            for name, step_fn in steps:
+                ok = step_fn()
+                self._flush_log()
+                if not ok:
+                    print(f"\n{'─' * 76}")
+                    print(f"  Flow stopped at: {name}")
+                    print(f"  Completed: {completed}/{len(steps)} steps")
+                    print(f"{'─' * 76}\n")
+                    break
+                completed += 1
+        finally:
+            # Write out everything logged so far, even if a step raised
+            self._flush_log()
         
         self.print_summary(completed)
+        sys.stdout.flush()
     
-    def print_summary(self, completed: int):
+    def print_summary(self, completed: int) -> None:
         print("""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                          REVERSE ENGINEERING SUMMARY                         ║
@@ -381,10 +508,17 @@ class SecureRegistrationClient:
         """)
 
 
-if __name__ == "__main__":
+def main() -> None:
+    # Log output is flushed explicitly at step boundaries (see _flush_log)
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
     client = SecureRegistrationClient(
         username="testuser",
         email="test@test.com",
         password="test123"
     )
     client.run()
+
+
+if __name__ == "__main__":
+    main()